@@ -8,6 +8,7 @@ import os
 import platform
 import importlib
 import importlib.util
+from functools import lru_cache
 from pathlib import Path
 
 def print_header(title):
@@ -15,6 +16,7 @@ def print_header(title):
     print(f"  {title}")
     print(f"{'='*60}")
 
+@lru_cache(maxsize=None)
 def safe_find_spec(name):
     """Safely check for module spec without raising exceptions."""
     try:
@@ -30,37 +32,57 @@ def safe_find_spec(name):
     except Exception:
         return None
 
+# Import name -> distribution name, for packages where they differ
+DIST_NAMES = {
+    "PIL": "Pillow",
+    "pillow_heif": "pillow-heif",
+    "skimage": "scikit-image",
+    "exifread": "ExifRead",
+}
+
+@lru_cache(maxsize=None)
 def get_version(module_name):
-    """Attempt to retrieve version from module."""
+    """
+    Retrieve a package version.
+
+    Reads installed distribution metadata first (no module code runs);
+    only imports the module when no metadata is available.
+    """
+    base = module_name.split('.')[0]
+    try:
+        from importlib.metadata import version
+        return version(DIST_NAMES.get(base, base))
+    except Exception:
+        pass
+
     try:
-        mod = importlib.import_module(module_name.split('.')[0])
+        mod = importlib.import_module(base)
         for attr in ['__version__', 'VERSION', 'version']:
             if hasattr(mod, attr):
                 ver = getattr(mod, attr)
                 return str(ver) if ver else "unknown"
-        
-        try:
-            from importlib.metadata import version
-            return version(module_name.split('.')[0])
-        except Exception:
-            pass
-            
         return "unknown"
     except Exception:
         return "unknown"
 
-def check_module(name, attribute=None):
+def check_module(name, attribute=None, load=False):
     """
     Safely check if a module exists and optionally verify an attribute.
+    The module is only imported when an attribute must be verified or
+    load is set (native extensions that may be broken despite being installed);
+    plain existence checks rely on find_spec alone.
     Returns (success: bool, message: str)
     """
     spec = safe_find_spec(name)
     if spec is None:
         return False, "Not installed"
-    
+
+    if attribute is None and not load:
+        return True, f"v{get_version(name)}"
+
     try:
         module = importlib.import_module(name)
-        if attribute and not hasattr(module, attribute):
+        if attribute is not None and not hasattr(module, attribute):
             return False, f"Missing attribute '{attribute}'"
         
         version = get_version(name)
@@ -125,18 +147,20 @@ def main():
         print("   pyenv install 3.12 --force")
 
     print_header("Critical Dependencies")
+    # (module, display name, import it): compiled packages are imported so a
+    # missing shared library or ABI mismatch fails here rather than at runtime
     critical = [
-        ("PIL", "Pillow"),
-        ("pillow_heif", "pillow-heif"),
-        ("ttkbootstrap", "ttkbootstrap"),
-        ("numpy", "numpy"),
-        ("exifread", "ExifRead"),
-        ("appdirs", "appdirs"),
+        ("PIL.Image", "Pillow", True),
+        ("pillow_heif", "pillow-heif", True),
+        ("ttkbootstrap", "ttkbootstrap", False),
+        ("numpy", "numpy", True),
+        ("exifread", "ExifRead", False),
+        ("appdirs", "appdirs", False),
     ]
     
     failures = []
-    for module_name, display_name in critical:
-        ok, msg = check_module(module_name)
+    for module_name, display_name, load in critical:
+        ok, msg = check_module(module_name, load=load)
         status = "✅" if ok else "❌"
         print(f"{status} {display_name:<20} : {msg}")
         if not ok:
@@ -1,7 +1,8 @@
 import json
+import os
 import subprocess
 from pathlib import Path
-from PIL import Image, ExifTags, TiffImagePlugin
+from PIL import Image, ExifTags, TiffTags
 from PIL.TiffImagePlugin import IFDRational
 
 # ==========================================================
@@ -16,13 +17,10 @@ def safe_call(fn, default=None):
         return {"_error": str(e)}
 
 
-def decode_tiff_tag(tag_id):
-    # NOTE: I have been told TAGS_V2 was removed/refactored, may need to adjust this implementation for reliability
-    return TiffImagePlugin.TAGS_V2.get(tag_id, f"Unknown({tag_id})")
-
-
-def decode_exif_tag(tag_id):
-    return ExifTags.TAGS.get(tag_id, f"Unknown({tag_id})")
+# Tag-name tables built once. TiffImagePlugin has no TAGS_V2; TiffTags.TAGS
+# already merges the TAGS_V2 names and also holds (tag, value) keys we skip.
+_TIFF_TAG_NAMES = {k: v for k, v in TiffTags.TAGS.items() if isinstance(k, int)}
+_EXIF_TAG_NAMES = dict(ExifTags.TAGS)
 
 
 def json_safe(value):
@@ -51,6 +49,7 @@ def json_safe(value):
 
 def extract_metadata_pillow(img: Image.Image):
     meta = {}
+    tag_v2 = getattr(img, "tag_v2", None)  # TIFF tag directory, if any
 
     # -------------------------------
     # Core image info
@@ -70,9 +69,8 @@ def extract_metadata_pillow(img: Image.Image):
         if dpi:
             return {"x": dpi[0], "y": dpi[1], "unit": "dpi"}
 
-        if hasattr(img, "tag_v2"):
-            x = img.tag_v2.get(282)  # XResolution
-            y = img.tag_v2.get(283)  # YResolution
+        if tag_v2 is not None:
+            x, y = tag_v2.get(282), tag_v2.get(283)  # X/YResolution
             if x and y:
                 return {"x": float(x), "y": float(y), "unit": "dpi (TIFF)"}
         return None
@@ -95,8 +93,9 @@ def extract_metadata_pillow(img: Image.Image):
         exif = img.getexif()
         if not exif:
             return None
+        name_of = _EXIF_TAG_NAMES.get
         return {
-            decode_exif_tag(tag_id): value
+            name_of(tag_id) or f"Unknown({tag_id})": value
             for tag_id, value in exif.items()
         }
 
@@ -106,14 +105,14 @@ def extract_metadata_pillow(img: Image.Image):
     # TIFF tags (scanner-style)
     # -------------------------------
     def get_tiff_tags():
-        if not hasattr(img, "tag_v2"):
+        if tag_v2 is None:
             return None
 
-        tags = {}
-        for tag_id, value in img.tag_v2.items():
-            name = decode_tiff_tag(tag_id)
-            tags[name] = value
-        return tags
+        name_of = _TIFF_TAG_NAMES.get
+        return {
+            name_of(tag_id) or f"Unknown({tag_id})": value
+            for tag_id, value in tag_v2.items()
+        }
 
     meta["tiff"] = safe_call(get_tiff_tags)
 
@@ -124,23 +123,48 @@ def extract_metadata_pillow(img: Image.Image):
 # EXIFTOOL METADATA EXTRACTION
 # ==========================================================
 
-def extract_metadata_exiftool(image_path: Path):
+def _path_key(path) -> str:
+    """Comparable form of a path: exiftool echoes SourceFile with forward slashes on Windows."""
+    return os.path.normcase(os.path.abspath(path))
+
+
+def extract_metadata_exiftool_batch(image_paths):
+    """
+    Run exiftool once for all paths (one process instead of one per image).
+    Returns {Path: metadata dict}; entries are matched back via SourceFile.
+    """
+    image_paths = list(image_paths)
+    if not image_paths:
+        return {}
+
     try:
         result = subprocess.run(
-            ["exiftool", "-json", "-G", "-n", str(image_path)],
+            ["exiftool", "-json", "-G", "-n", *map(str, image_paths)],
             capture_output=True,
             text=True,
-            check=True,
+            check=False,
         )
-        data = json.loads(result.stdout)
-        return data[0] if data else {}
     except FileNotFoundError:
-        return {"_error": "exiftool not found on PATH"}
-    except subprocess.CalledProcessError as e:
-        return {
-            "_error": "exiftool failed",
-            "stderr": e.stderr,
-        }
+        return {p: {"_error": "exiftool not found on PATH"} for p in image_paths}
+
+    try:
+        data = json.loads(result.stdout) if result.stdout.strip() else []
+    except json.JSONDecodeError:
+        data = []
+
+    by_source = {}
+    for entry in data:
+        # -G prefixes tags with their group, but SourceFile is ungrouped
+        source = entry.get("SourceFile")
+        if source is not None:
+            by_source[_path_key(source)] = entry
+
+    failed = {"_error": "exiftool failed", "stderr": result.stderr}
+    return {p: by_source.get(_path_key(p), failed) for p in image_paths}
+
+
+def extract_metadata_exiftool(image_path: Path):
+    return extract_metadata_exiftool_batch([image_path])[image_path]
 
 
 # ==========================================================
@@ -154,12 +178,18 @@ def main():
         # Path("examples/another_image.jpg"),
     ]
 
+    existing = []
     for image_path in image_paths:
-        print(f"\n🔍 Analyzing: {image_path}")
-
-        if not image_path.exists():
+        if image_path.exists():
+            existing.append(image_path)
+        else:
             print(f"⚠️  Skipping missing file: {image_path}")
-            continue
+
+    # Single exiftool process for the whole batch
+    exiftool_results = extract_metadata_exiftool_batch(existing)
+
+    for image_path in existing:
+        print(f"\n🔍 Analyzing: {image_path}")
 
         output_dir = image_path.parent
         stem = image_path.stem
@@ -174,20 +204,16 @@ def main():
             pillow_meta = {"_error": f"Pillow failed: {e}"}
 
         pillow_out = output_dir / f"{stem}.pillow.metadata.json"
-        pillow_out.write_text(
-            json.dumps(json_safe(pillow_meta), indent=2, sort_keys=False),
-            encoding="utf-8",
-        )
+        with pillow_out.open("w", encoding="utf-8") as f:
+            json.dump(json_safe(pillow_meta), f, indent=2, sort_keys=False)
 
         # ---------------------------
         # ExifTool extraction
         # ---------------------------
-        exiftool_meta = extract_metadata_exiftool(image_path)
+        exiftool_meta = exiftool_results[image_path]
         exiftool_out = output_dir / f"{stem}.exiftool.metadata.json"
-        exiftool_out.write_text(
-            json.dumps(exiftool_meta, indent=2, sort_keys=False),
-            encoding="utf-8",
-        )
+        with exiftool_out.open("w", encoding="utf-8") as f:
+            json.dump(exiftool_meta, f, indent=2, sort_keys=False)
 
         print(f"  ✔ Pillow:   {pillow_out.name}")
         print(f"  ✔ ExifTool: {exiftool_out.name}")
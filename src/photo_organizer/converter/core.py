@@ -2,25 +2,31 @@
 TIFF Converter Core - Professional Workflow
 Handles parallel processing, smart archiving, and multi-format output.
 """
+import errno
+import importlib.util
 import logging
+import multiprocessing
 import shutil
+import struct
+import sys
 import time
 import json
 import tempfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Callable, Dict, Optional
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 import os
+import numpy as np
 
-try:
-    from PIL import Image
-    import pillow_heif
-    pillow_heif.register_heif_opener()
-    HEIF_SAVE_AVAILABLE = True
-except ImportError:
-    HEIF_SAVE_AVAILABLE = False
-    from PIL import Image
+from PIL import Image
+
+# pillow_heif loads libheif and its codecs; only import it once HEIC output is requested
+HEIF_SAVE_AVAILABLE = importlib.util.find_spec("pillow_heif") is not None
 
 from PIL.TiffImagePlugin import IFDRational
 try:
@@ -33,7 +39,7 @@ from photo_organizer.converter.variant_selection import group_variants, choose_b
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class OpDetail:
     source: str
     action: str
@@ -43,12 +49,15 @@ class OpDetail:
     duration: float = 0.0
     error: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class ConversionResult:
     source_stem: str
     success: bool
     details: List[OpDetail] = field(default_factory=list)
 
+# Report keys for each OpDetail, in declaration order (slotted: no __dict__ to dump)
+_OP_FIELDS = tuple(f.name for f in fields(OpDetail))
+
 # Exclude tags that are layout/pointers/binary blobs and frequently break scanner TIFF re-save.
 EXCLUDED_TIFF_TAGS = {
     # Core image structure / offsets that MUST be regenerated
@@ -144,11 +153,147 @@ def _atomic_replace_temp(dest: Path, write_fn: Callable[[Path], None], cancel_ev
         except Exception:
             pass
 
+def _move_file(src: Path, dest: Path):
+    """Rename in place (originals/ sits beside the scans); copy only across devices."""
+    try:
+        os.replace(src, dest)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dest))
+
 def _check_cancel(cancel_event):
     """Checks if cancellation was requested and raises exception to stop flow."""
     if cancel_event and cancel_event.is_set():
         raise OperationCancelled("Process cancelled by user.")
 
+TIFF_SUFFIXES = ('.tif', '.tiff')
+
+# Each worker holds a full-resolution scan in memory, so stay well below the core count
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+
+# "thread" or "process" forces the pool type (e.g. to benchmark one against the other)
+EXECUTOR_ENV = "PHOTO_ORG_EXECUTOR"
+
+@lru_cache(maxsize=None)
+def _register_heif():
+    import pillow_heif
+    pillow_heif.register_heif_opener()
+
+def _init_worker(heif: bool):
+    """Once per converter process: load Pillow's core plugins, and HEIF if it will be written."""
+    Image.preinit()
+    if heif:
+        _register_heif()
+
+@lru_cache(maxsize=None)
+def _process_context():
+    """
+    forkserver on Linux: the GUI runs conversions from a worker thread, and
+    forking a threaded Tk process is unsafe. The server preloads this module,
+    so each worker forks with numpy and Pillow already imported. Set up once;
+    the preload list is process-wide multiprocessing state.
+    Other platforms keep their default (spawn).
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload([__name__])
+    return ctx
+
+def _pick_executor_kind() -> str:
+    """Process pool unless overridden, or unless this interpreter runs without a GIL."""
+    kind = os.environ.get(EXECUTOR_ENV, "").strip().lower()
+    if kind in ("thread", "process"):
+        return kind
+    if kind:
+        logger.warning("Ignoring %s=%r (expected 'thread' or 'process')", EXECUTOR_ENV, kind)
+    # Free-threaded builds (3.13t+) run encoders in parallel on plain threads
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    if is_gil_enabled is not None and not is_gil_enabled():
+        return "thread"
+    return "process"
+
+def _wait_result(future: Future, cancel_event):
+    """Block on a worker result while still honouring cancellation."""
+    while True:
+        _check_cancel(cancel_event)
+        try:
+            return future.result(timeout=0.25)
+        except TimeoutError:
+            continue
+
+def _convert_variant(variant: Path, dest_tiff: Optional[Path], compression: str,
+                     heic_dest: Optional[Path], heic_quality: int,
+                     jpg_dest: Optional[Path], jpg_quality: int,
+                     dry_run: bool, cancel_event=None) -> tuple[bool, List[OpDetail]]:
+    """
+    Lossless TIFF for one scan, then its HEIC/JPG copies (skipped when dest is None).
+    The source is opened and decoded once for all outputs.
+    May run in a worker process: arguments and results must pickle, so there
+    cancel_event is None and a cancel request only takes effect between variants.
+    """
+    details = []
+    img = None
+    try:
+        # A. Mandatory Lossless TIFF
+        tiff_success = True
+        if dest_tiff is not None:
+            tiff_success = False
+            detail = OpDetail(source=variant.name, action=f"TIFF-{compression.upper()}", output=dest_tiff.name, success=False)
+            t0 = time.time()
+            try:
+                if not dry_run:
+                    img = Image.open(variant)
+                    exif_dropped = _save_tiff(img, dest_tiff, compression, cancel_event)
+                    if exif_dropped:
+                        detail.error = exif_dropped  # still a success: pixels are intact
+                    detail.size_bytes = dest_tiff.stat().st_size
+                detail.success = True
+                tiff_success = True
+            except OperationCancelled:
+                raise
+            except Exception as e:
+                detail.error = str(e)
+            detail.duration = round(time.time() - t0, 3)
+            details.append(detail)
+
+        if not tiff_success:
+            return False, details
+
+        # B. Conversions (HEIC/JPG)
+        export = None
+        for dest, fmt, action, qual in ((heic_dest, "HEIF", "HEIC", heic_quality),
+                                        (jpg_dest, "JPEG", "JPG", jpg_quality)):
+            if dest is None:
+                continue
+            det = OpDetail(source=variant.name, action=action, output=dest.name, success=False)
+            t0 = time.time()
+            try:
+                if not dry_run:
+                    if export is None:
+                        if img is None:
+                            img = Image.open(variant)
+                        export = _to_export_mode(img)
+                        if export is not img:
+                            # The source decode is no longer needed; free it before encoding
+                            img.close()
+                            img = None
+                    _save_image(export, dest, fmt, qual, cancel_event)
+                    det.size_bytes = dest.stat().st_size
+                det.success = True
+            except OperationCancelled:
+                raise
+            except Exception as e:
+                det.error = str(e)
+            det.duration = round(time.time() - t0, 3)
+            details.append(det)
+
+        return True, details
+    finally:
+        if img is not None:
+            img.close()
+
 def process_epson_folder(folder_path: Path, options: dict, progress_callback: Callable, log_callback: Callable) -> List[ConversionResult]:
     def _log(msg):
         if log_callback: log_callback(msg)
@@ -159,9 +304,18 @@ def process_epson_folder(folder_path: Path, options: dict, progress_callback: Ca
     create_tiff = True # Forced by requirements
     compression = options.get('compression', 'deflate')  # 'deflate' (ZIP) or 'lzw'
     create_heic = options.get('create_heic', True)
+    use_heif = create_heic and HEIF_SAVE_AVAILABLE
+    if use_heif:
+        try:
+            _register_heif()
+        except ImportError as e:
+            _log(f"HEIC output unavailable: {e}")
+            use_heif = False
     heic_quality = options.get('heic_quality', 100)
     create_jpg = options.get('create_jpg', False)
     jpg_quality = options.get('jpg_quality', 95)
+    # Dry runs only build the plan; a process pool would cost more than it saves
+    workers = 1 if dry_run else max(1, int(options.get('workers') or DEFAULT_WORKERS))
     
     # FastFoto Workflow
     ff_policy = options.get('variant_policy', 'smart')
@@ -184,8 +338,14 @@ def process_epson_folder(folder_path: Path, options: dict, progress_callback: Ca
             d.mkdir(parents=True, exist_ok=True)
 
     # 3. Scanning
-    # Get all TIFFs that are in the root folder (exclude subfolders)
-    tiff_files = [f for f in folder_path.glob("*.[tT][iI][fF]*") if f.is_file() and f.parent == folder_path]
+    # Get all TIFFs that are in the root folder (exclude subfolders); one directory
+    # read, file type from the DirEntry. Hidden files (e.g. macOS "._" resource
+    # forks) are skipped, as glob did.
+    with os.scandir(folder_path) as it:
+        tiff_files = [Path(e.path) for e in it
+                      if not e.name.startswith('.')
+                      and e.name.lower().endswith(TIFF_SUFFIXES)
+                      and e.is_file()]
     
     if not tiff_files:
         _log("No TIFF files found in source directory.")
@@ -194,6 +354,85 @@ def process_epson_folder(folder_path: Path, options: dict, progress_callback: Ca
     groups = group_variants(tiff_files)
     results = []
     total_groups = len(groups)
+    total_files = sum(len(v) for v in groups.values())
+    files_done = 0
+
+    # Variant analysis stays on this thread; encoding is farmed out to worker
+    # processes and groups are finalized in order as their variants complete.
+    def _new_process_pool() -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=workers, mp_context=_process_context(),
+                                   initializer=_init_worker, initargs=(use_heif,))
+
+    if workers > 1 and _pick_executor_kind() == "thread":
+        _init_worker(use_heif)  # plugins are registered process-wide
+        executor = ThreadPoolExecutor(max_workers=workers)
+    elif workers > 1:
+        # Processes even for TIFF-only runs: Pillow's libtiff writer (LZW/Deflate)
+        # encodes via encoder.encode(), which holds the GIL, so threads would serialize
+        executor = _new_process_pool()
+    else:
+        executor = None
+        _init_worker(use_heif)
+    pending = deque()  # (idx, stem, [(variant, future), ...]) in group order
+    # Keep every worker fed with one queued variant behind the running one, but
+    # don't let selection race ahead of encoding or hold the results for the
+    # whole folder before any originals are moved.
+    max_in_flight = 2 * workers
+
+    def _submit(*args) -> Future:
+        nonlocal executor
+        if isinstance(executor, ProcessPoolExecutor):
+            # An Event can't be sent to another process; cancel is checked between variants
+            try:
+                return executor.submit(_convert_variant, *args)
+            except BrokenProcessPool:
+                # A worker died (e.g. killed for memory); its queued variants are
+                # recorded as failed, later ones get a fresh pool
+                executor.shutdown(wait=False, cancel_futures=True)
+                executor = _new_process_pool()
+                return executor.submit(_convert_variant, *args)
+        if executor is not None:
+            return executor.submit(_convert_variant, *args, cancel_event)
+        future = Future()
+        future.set_result(_convert_variant(*args, cancel_event))
+        return future
+
+    def _finish_group(idx, stem, jobs):
+        nonlocal files_done
+        group_details = []
+        variants_processed_successfully = []
+        for variant, future in jobs:
+            try:
+                tiff_success, details = _wait_result(future, cancel_event)
+            except BrokenProcessPool:
+                tiff_success = False
+                details = [OpDetail(source=variant.name, action=f"TIFF-{compression.upper()}",
+                                    output="", success=False,
+                                    error="Worker process terminated abruptly")]
+            # Per-file progress: a group of several variants no longer stalls the bar
+            files_done += 1
+            progress_callback((files_done / total_files) * 100)
+            for detail in details:
+                if detail.action.startswith("TIFF") and not detail.success:
+                    _log(f"  Error (TIFF): {detail.error}")
+                elif detail.error:
+                    _log(f"  Warning ({detail.action}): {detail.source}: {detail.error}")
+            group_details.extend(details)
+            if tiff_success:
+                variants_processed_successfully.append(variant)
+
+        # 6. Move Originals
+        if not dry_run:
+            for variant in variants_processed_successfully:
+                _check_cancel(cancel_event)
+                try:
+                    _move_file(variant, dirs['originals'] / variant.name)
+                    group_details.append(OpDetail(variant.name, "MOVE_ORIGINAL", "originals/", True))
+                except Exception as e:
+                    _log(f"  Failed to move original {variant.name}: {e}")
+                    group_details.append(OpDetail(variant.name, "MOVE_ORIGINAL", "originals/", False, error=str(e)))
+
+        results.append(ConversionResult(stem, True, group_details))
 
     try:
         for idx, (stem, variants) in enumerate(groups.items(), 1):
@@ -228,16 +467,11 @@ def process_epson_folder(folder_path: Path, options: dict, progress_callback: Ca
                     selected_fronts = [fronts[0]]
                     rejected_fronts = fronts[1:]
 
-            group_details = []
-            variants_processed_successfully = []
-            
-            all_process_candidates = fronts + backs
-
             # 5. Process Files
-            for variant in all_process_candidates:
+            jobs = []
+            for variant in fronts + backs:
                 _check_cancel(cancel_event)
                 
-                # A. Mandatory Lossless TIFF
                 is_rejected = (variant in rejected_fronts)
                 
                 # Determine destination: Archive if rejected & smart archive ON, else standard lossless folder
@@ -245,80 +479,26 @@ def process_epson_folder(folder_path: Path, options: dict, progress_callback: Ca
                 
                 # Suffix logic
                 suffix = ".ZIP.TIF" if compression == 'deflate' else ".LZW.TIF"
-                dest_tiff = target_dir / f"{variant.stem}{suffix}"
-                
-                tiff_success = False
-                if create_tiff:
-                    detail = OpDetail(source=variant.name, action=f"TIFF-{compression.upper()}", output=dest_tiff.name, success=False)
-                    t0 = time.time()
-                    
-                    try:
-                        if not dry_run:
-                            _save_tiff(variant, dest_tiff, compression, cancel_event)
-                            detail.size_bytes = dest_tiff.stat().st_size
-                        detail.success = True
-                        tiff_success = True
-                        variants_processed_successfully.append(variant)
-                    except Exception as e:
-                        detail.error = str(e)
-                        _log(f"  Error (TIFF): {e}")
-                    
-                    detail.duration = round(time.time() - t0, 3)
-                    group_details.append(detail)
-                else:
-                    tiff_success = True
-                    variants_processed_successfully.append(variant)
+                dest_tiff = target_dir / f"{variant.stem}{suffix}" if create_tiff else None
 
-                # B. Conversions (HEIC/JPG)
                 # Logic: Convert if it's a "Select", a "Backside", or if Smart Conversion is DISABLED
                 should_convert = (variant in selected_fronts) or (variant in backs) or (not ff_smart_convert)
+                heic_dest = dirs['heic'] / f"{variant.stem}.heic" if (should_convert and use_heif) else None
+                jpg_dest = dirs['jpg'] / f"{variant.stem}.jpg" if (should_convert and create_jpg) else None
 
-                if should_convert and tiff_success:
-                    # HEIC
-                    if create_heic and HEIF_SAVE_AVAILABLE:
-                        h_dest = dirs['heic'] / f"{variant.stem}.heic"
-                        h_det = OpDetail(source=variant.name, action="HEIC", output=h_dest.name, success=False)
-                        t0 = time.time()
-                        try:
-                            if not dry_run:
-                                _save_image(variant, h_dest, "HEIF", heic_quality, cancel_event)
-                                h_det.size_bytes = h_dest.stat().st_size
-                            h_det.success = True
-                        except Exception as e:
-                            h_det.error = str(e)
-                        h_det.duration = round(time.time() - t0, 3)
-                        group_details.append(h_det)
-                    
-                    # JPG
-                    if create_jpg:
-                        j_dest = dirs['jpg'] / f"{variant.stem}.jpg"
-                        j_det = OpDetail(source=variant.name, action="JPG", output=j_dest.name, success=False)
-                        t0 = time.time()
-                        try:
-                            if not dry_run:
-                                _save_image(variant, j_dest, "JPEG", jpg_quality, cancel_event)
-                                j_det.size_bytes = j_dest.stat().st_size
-                            j_det.success = True
-                        except Exception as e:
-                            j_det.error = str(e)
-                        j_det.duration = round(time.time() - t0, 3)
-                        group_details.append(j_det)
-
-            # 6. Move Originals
-            if not dry_run:
-                for variant in variants_processed_successfully:
-                    _check_cancel(cancel_event)
-                    try:
-                        shutil.move(str(variant), str(dirs['originals'] / variant.name))
-                        group_details.append(OpDetail(variant.name, "MOVE_ORIGINAL", "originals/", True))
-                    except Exception as e:
-                        _log(f"  Failed to move original {variant.name}: {e}")
-                        group_details.append(OpDetail(variant.name, "MOVE_ORIGINAL", "originals/", False, error=str(e)))
-
-            results.append(ConversionResult(stem, True, group_details))
-            
-            # Progress Update
-            progress_callback((idx / total_groups) * 100)
+                jobs.append((variant, _submit(variant, dest_tiff, compression, heic_dest, heic_quality,
+                                              jpg_dest, jpg_quality, dry_run)))
+            pending.append((idx, stem, jobs))
+
+            # Finalize whatever has already completed, in group order, then
+            # block on the oldest groups while too many variants are queued
+            while pending and all(f.done() for _, f in pending[0][2]):
+                _finish_group(*pending.popleft())
+            while sum(len(j) for _, _, j in pending) > max_in_flight:
+                _finish_group(*pending.popleft())
+
+        while pending:
+            _finish_group(*pending.popleft())
 
     except OperationCancelled:
         _log("🛑 Process Cancelled.")
@@ -326,27 +506,52 @@ def process_epson_folder(folder_path: Path, options: dict, progress_callback: Ca
     except Exception as e:
         _log(f"❌ Fatal Error: {e}")
         logger.exception("Core loop crash")
+    finally:
+        if executor is not None:
+            # Drop queued variants; running ones finish their atomic writes
+            executor.shutdown(wait=True, cancel_futures=True)
         
     return results
 
-def _save_tiff(src: Path, dest: Path, algo: str, cancel_event):
-    # Pillow TIFF compression names vary; these are commonly supported:
-    # - "tiff_lzw"
-    # - "tiff_adobe_deflate" (best default; “ZIP-like”)
-    comp = "tiff_adobe_deflate" if algo in ("deflate", "adobe_deflate", "zip") else "tiff_lzw"
+# Pillow TIFF compression names vary; these are commonly supported:
+# - "tiff_lzw"
+# - "tiff_adobe_deflate" (best default; “ZIP-like”)
+# Any other option value falls back to LZW.
+TIFF_COMPRESSION = {
+    "deflate": "tiff_adobe_deflate",
+    "adobe_deflate": "tiff_adobe_deflate",
+    "zip": "tiff_adobe_deflate",
+    "lzw": "tiff_lzw",
+}
+
+def _save_tiff(img: Image.Image, dest: Path, algo: str, cancel_event) -> Optional[str]:
+    """Returns why the EXIF was left out, or None when it was kept (or absent)."""
+    comp = TIFF_COMPRESSION.get(algo, "tiff_lzw")
+    exif_dropped = None
+
+    # Already stored with the requested codec: the bytes on disk are the lossless
+    # output, so copy them rather than decoding and re-encoding every strip
+    if (img.info.get("compression") == comp and getattr(img, "filename", "")
+            and getattr(img, "n_frames", 1) == 1):
+        _atomic_replace_temp(dest, lambda tmp_path: shutil.copyfile(img.filename, tmp_path),
+                             cancel_event=cancel_event)
+        return None
 
     def _write(tmp_path: Path):
-        with Image.open(src) as img:
-            icc = img.info.get("icc_profile")
+        nonlocal exif_dropped
+        icc = img.info.get("icc_profile")
+        # Hand the parsed Exif straight to the TIFF writer: serializing it with
+        # tobytes() only for save() to parse it back costs a copy of every tag
+        exif = None
+        try:
+            ex = img.getexif()
+            if ex:
+                exif = ex
+        except Exception:
             exif = None
-            try:
-                ex = img.getexif()
-                if ex:
-                    exif = ex.tobytes()
-            except Exception:
-                exif = None
 
-            # Robust default: do not attempt full TIFF tag round-trip
+        # Robust default: do not attempt full TIFF tag round-trip
+        try:
             img.save(
                 tmp_path,
                 format="TIFF",
@@ -354,31 +559,84 @@ def _save_tiff(src: Path, dest: Path, algo: str, cancel_event):
                 icc_profile=icc,
                 exif=exif,
             )
+        except (TypeError, ValueError, struct.error) as e:
+            if exif is None:
+                raise
+            # A tag the writer can't serialize; keep the pixels, drop the EXIF
+            exif_dropped = f"EXIF dropped ({e})"
+            logger.warning("%s: %s", dest.name, exif_dropped)
+            img.save(
+                tmp_path,
+                format="TIFF",
+                compression=comp,
+                icc_profile=icc,
+            )
 
     _atomic_replace_temp(dest, _write, cancel_event=cancel_event)
+    return exif_dropped
+
+# Single-channel modes that Pillow's convert() clips rather than scales down to 8-bit
+HIGH_BIT_MODES = {"I;16", "I;16L", "I;16B", "I;16N", "I", "F"}
 
-def _save_image(src, dest, fmt, qual, cancel_event):
+def _to_8bit(img: Image.Image) -> Image.Image:
+    """
+    Scale a 16-bit/32-bit grayscale image to mode L.
+    16-bit data keeps its tonal range via the high byte; anything else is
+    stretched from its min/max.
+    """
+    arr = np.asarray(img)
+    if arr.dtype.itemsize == 2 and arr.dtype.kind == "u":
+        # The high byte is already in the buffer: take a strided uint8 view of it
+        # and make a single contiguous copy, instead of shifting then narrowing
+        high = 0 if arr.dtype.str[0] == ">" else 1
+        return Image.fromarray(np.ascontiguousarray(arr.view(np.uint8)[..., high::2]))
+
+    lo, hi = arr.min(), arr.max()
+    if arr.dtype.kind in "ui" and lo >= 0 and hi <= 0xFFFF:
+        return Image.fromarray((arr >> 8).astype(np.uint8))
+
+    # One float32 working copy, normalized in place
+    work = arr.astype(np.float32)
+    del arr
+    scale = 255.0 / (float(hi) - float(lo)) if hi > lo else 0.0
+    work -= lo
+    work *= scale
+    work += 0.5
+    return Image.fromarray(work.astype(np.uint8))
+
+def _to_export_mode(img: Image.Image) -> Image.Image:
+    """8-bit RGB/L version of img for HEIC/JPG; computed once and shared by both."""
+    if img.mode in HIGH_BIT_MODES:
+        return _to_8bit(img)
+    if img.mode not in ("RGB", "L"):
+        return img.convert("RGB")
+    return img
+
+def _save_image(img: Image.Image, dest: Path, fmt: str, qual: int, cancel_event):
     def _write(tmp_path: Path):
-        with Image.open(src) as img:
-            if img.mode not in ("RGB", "L"):
-                img = img.convert("RGB")
-            img.save(tmp_path, format=fmt, quality=qual)
+        img.save(tmp_path, format=fmt, quality=qual)
 
     _atomic_replace_temp(dest, _write, cancel_event=cancel_event)
 
 def save_report(results: List[ConversionResult], output_path: Path):
+    successful = 0
+    total_ops = 0
+    for r in results:
+        successful += r.success
+        total_ops += len(r.details)
+
     data = {
         "timestamp": datetime.now().isoformat(),
         "summary": {
             "total_groups": len(results),
-            "successful_groups": sum(1 for r in results if r.success),
-            "total_operations": sum(len(r.details) for r in results)
+            "successful_groups": successful,
+            "total_operations": total_ops
         },
         "groups": [
             {
                 "group": r.source_stem,
                 "success": r.success,
-                "ops": [vars(d) for d in r.details]
+                "ops": [{name: getattr(d, name) for name in _OP_FIELDS} for d in r.details]
             } for r in results
         ]
     }
@@ -386,4 +644,4 @@ def save_report(results: List[ConversionResult], output_path: Path):
         with open(output_path, 'w') as f:
             json.dump(data, f, indent=2)
     except Exception as e:
-        logger.error(f"Failed to save report: {e}")
+        logger.error("Failed to save report: %s", e)
@@ -11,7 +11,7 @@ import errno
 import atexit
 import appdirs
 
-from photo_organizer.converter.core import process_epson_folder, save_report, HEIF_SAVE_AVAILABLE, OperationCancelled
+from photo_organizer.converter.core import process_epson_folder, save_report, HEIF_SAVE_AVAILABLE, OperationCancelled, DEFAULT_WORKERS
 from photo_organizer.shared.gui_utils import ToolTip
 
 # Set up module logger that propagates to root (and thus to Launcher's listener)
@@ -141,6 +141,7 @@ class TIFFConverterGUI:
         self.heic_qual = tk.IntVar(value=100)
         self.create_jpg = tk.BooleanVar(value=False)
         self.jpg_qual = tk.IntVar(value=95)
+        self.workers = tk.IntVar(value=DEFAULT_WORKERS)
         
         # FastFoto Workflow
         self.ff_enabled = tk.BooleanVar(value=True)
@@ -241,6 +242,10 @@ class TIFFConverterGUI:
         row_exec = ttk.Frame(main, padding=(0, 10))
         row_exec.pack(fill=tk.X)
         safe_widget_create(ttk.Checkbutton, row_exec, text="Dry Run Mode (No changes)", variable=self.dry_run, command=self._toggle_dry_run, bootstyle="danger-round-toggle").pack(side=tk.LEFT)
+        sp_workers = safe_widget_create(ttk.Spinbox, row_exec, from_=1, to=os.cpu_count() or 1, textvariable=self.workers, width=4)
+        sp_workers.pack(side=tk.RIGHT)
+        ttk.Label(row_exec, text="Parallel workers:").pack(side=tk.RIGHT, padx=5)
+        ToolTip(sp_workers, "Files converted at once. Each worker holds a full scan in memory.")
 
         # Progress
         self.pbar = safe_widget_create(ttk.Progressbar, main, variable=self.progress_val, bootstyle="success-striped")
@@ -371,6 +376,7 @@ class TIFFConverterGUI:
                 "heic_quality": int(self.heic_qual.get()),
                 "create_jpg": self.create_jpg.get(),
                 "jpg_quality": int(self.jpg_qual.get()),
+                "workers": self._get_workers(),
                 "variant_policy": self.ff_policy.get() if self.ff_enabled.get() else 'none',
                 "variant_smart_archiving": self.ff_smart_archive.get(),
                 "variant_smart_conversion": self.ff_smart_convert.get(),
@@ -404,6 +410,12 @@ class TIFFConverterGUI:
             )
         # IMPORTANT: no direct widget ops here (worker thread)
 
+    def _get_workers(self) -> int:
+        try:
+            return max(1, int(self.workers.get()))
+        except (tk.TclError, ValueError):
+            return DEFAULT_WORKERS
+
     def _update_progress(self, val):
         self.root.after(0, lambda: self.progress_val.set(val))
         self.root.after(0, lambda: self.status_var.set(f"Processing: {int(val)}%"))
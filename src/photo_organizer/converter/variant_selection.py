@@ -80,7 +80,7 @@ def compute_quality_metrics(image_path: Path, cancel_event=None) -> Dict[str, fl
     except OperationCancelled:
         raise
     except Exception as e:
-        logger.warning(f"Failed to compute metrics for {image_path}: {e}")
+        logger.warning("Failed to compute metrics for %s: %s", image_path, e)
         return {'sharpness': 0.0, 'score': 0.0}
 
 def compute_quality_score(metrics: Dict[str, float]) -> float:
@@ -122,8 +122,9 @@ class LauncherApp:
             # 4. Update UI
             btn.config(state=tk.DISABLED)
             self.processes[module_name] = {'proc': proc, 'btn': btn}
-            self.status_var.set(f"Launched: {module_name.split('.')[-1]}")
-            logger.info(f"🚀 Launched {module_name} (PID {proc.pid})")
+            # Let the click handler return before Tk redraws the status bar
+            self.root.after_idle(self.status_var.set, f"Launched: {module_name.split('.')[-1]}")
+            logger.info("🚀 Launched %s (PID %s)", module_name, proc.pid)
 
             # 5. Monitor threads
             threading.Thread(target=self._stream_output, args=(
@@ -144,7 +145,7 @@ class LauncherApp:
     def _watch_exit(self, name, btn, proc):
         """Enables the button when process exits."""
         rc = proc.wait()
-        logger.info(f"🏁 {name} exited with code {rc}")
+        logger.info("🏁 %s exited with code %s", name, rc)
 
         def _reset():
             if name in self.processes:
@@ -4,20 +4,71 @@ Organizes files by date and camera model with various options.
 """
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from photo_organizer.shared.metadata import get_creation_date, get_camera_model
-from photo_organizer.shared.camera_models import get_camera_models, add_camera_model
+from photo_organizer.shared.camera_models import get_camera_models, add_camera_models
+from photo_organizer.shared.file_utils import iter_files
 from photo_organizer.shared.config import (
-    VIDEO_EXTENSIONS, VIDEO_EXTENSIONS_EXTRAS, PHOTO_EXTENSIONS, ALL_EXTENSIONS
+    VIDEO_EXTENSION_SET, VIDEO_EXTRAS_EXTENSION_SET, PHOTO_EXTENSION_SET, ALL_EXTENSION_SET,
+    UNKNOWN_CAMERA, HIF_EXTENSION, MP4_EXTENSION
 )
 
+# EXIF probing is I/O bound; threads overlap disk reads while the GIL is released
+PROBE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Media-type subfolder per extension; anything else (video extras) goes to "other"
+MEDIA_TYPE_FOLDERS = {
+    **dict.fromkeys(PHOTO_EXTENSION_SET, "photos"),
+    **dict.fromkeys(VIDEO_EXTENSION_SET, "videos"),
+}
+
+
+def _probe(entry: os.DirEntry) -> tuple[str, str] | None:
+    """Return (date_folder, camera_model) for a single file, or None if it has vanished."""
+    try:
+        # EXIF readers swallow their own errors; a missing file surfaces from
+        # the mtime fallback's stat
+        return get_creation_date(entry.path, entry), get_camera_model(entry.path)
+    except OSError:
+        return None
+
+
+def _pick_dest_formatter(
+    folder_path: str,
+    by_camera_model: bool,
+    add_model_to_folder: bool,
+    separate_photos_videos: bool
+):
+    """
+    Choose the destination-folder layout once per run.
+    The returned callable takes (camera_model, media_type_folder, date_folder).
+    """
+    if by_camera_model and add_model_to_folder:
+        if separate_photos_videos:
+            return lambda cm, mtf, df: os.path.join(folder_path, cm, mtf, f"{df}_{cm}")
+        return lambda cm, mtf, df: os.path.join(folder_path, cm, f"{df}_{cm}")
+    if by_camera_model:
+        if separate_photos_videos:
+            return lambda cm, mtf, df: os.path.join(folder_path, cm, mtf, df)
+        return lambda cm, mtf, df: os.path.join(folder_path, cm, df)
+    if add_model_to_folder:
+        if separate_photos_videos:
+            return lambda cm, mtf, df: os.path.join(folder_path, mtf, f"{df}_{cm}")
+        return lambda cm, mtf, df: os.path.join(folder_path, f"{df}_{cm}")
+    if separate_photos_videos:
+        return lambda cm, mtf, df: os.path.join(folder_path, mtf, df)
+    return lambda cm, mtf, df: os.path.join(folder_path, df)
+
 
 def organize_photos(
     folder_path: str,
     by_camera_model: bool = True,
     add_model_to_folder: bool = False,
     media_type: str = "both",
-    separate_photos_videos: bool = True
+    separate_photos_videos: bool = True,
+    files: list[os.DirEntry] | None = None,
+    max_workers: int = PROBE_WORKERS
 ):
     """
     Organize photos and videos by date and camera model.
@@ -28,6 +79,9 @@ def organize_photos(
         add_model_to_folder: Add camera model suffix to date folders
         media_type: "photos", "videos", or "both"
         separate_photos_videos: Create separate photos/videos subdirectories
+        files: Entries from a previous scan of folder_path (e.g. the GUI's
+            folder count); when given, the directory walk is skipped
+        max_workers: Threads used to read EXIF/XML metadata (1 = serial)
     """
     print("\n")
     print(f"Organize with camera model as parent folder (T/F): {by_camera_model}")
@@ -36,10 +90,10 @@ def organize_photos(
     print(f"Separate photos and videos: {separate_photos_videos}")
     print("\n")
 
-    # Use extension lists from config
-    photo_exts = [ext.upper() for ext in PHOTO_EXTENSIONS]
-    video_exts = [ext.upper() for ext in VIDEO_EXTENSIONS]
-    all_exts = [ext.upper() for ext in ALL_EXTENSIONS]
+    # Use extension sets from config (already upper-case)
+    photo_exts = PHOTO_EXTENSION_SET
+    video_exts = VIDEO_EXTENSION_SET
+    all_exts = ALL_EXTENSION_SET
 
     # Filter extensions based on media_type
     if media_type == "photos":
@@ -53,7 +107,7 @@ def organize_photos(
     def get_mp4_base(filename):
         # Handles Sony: C0063M01.XML -> C0063.MP4, GoPro: GH010038.LRV -> GH010038.MP4
         name, ext = os.path.splitext(filename)
-        if ext.upper() in VIDEO_EXTENSIONS_EXTRAS:
+        if ext.upper() in VIDEO_EXTRAS_EXTENSION_SET:
             # Remove known suffixes (Sony: M01, GoPro: LRV/THM)
             if name.endswith('M01'):
                 name = name[:-3]
@@ -61,127 +115,89 @@ def organize_photos(
                 name = name[:-3]
         return name
 
+    format_dest = _pick_dest_formatter(
+        folder_path, by_camera_model, add_model_to_folder, separate_photos_videos)
+
     known_files = {}
     mp4_dest_map = {}
     detected_models = set()
     
-    # First pass: build known_files for all modes
-    for root, _, files in os.walk(folder_path):
-        for file in files:
-            ext = os.path.splitext(file)[1].upper()
-            if ext in valid_exts:
-                file_path = os.path.join(root, file)
-                date_folder = get_creation_date(file_path)
-                camera_model = get_camera_model(file_path)
-                basename, _ = os.path.splitext(file)
-                if camera_model != "UnknownCamera":
-                    detected_models.add(camera_model)
-                
-                # Set media_type_folder only if separating photos/videos
-                if separate_photos_videos:
-                    if ext in photo_exts:
-                        media_type_folder = "photos"
-                    elif ext in video_exts:
-                        media_type_folder = "videos"
-                    else:
-                        media_type_folder = "other"
-                    if add_model_to_folder and camera_model != "UnknownCamera":
-                        media_type_folder = f"{media_type_folder}_{camera_model}"
-                else:
-                    media_type_folder = None
-                
-                if camera_model != "UnknownCamera":
-                    if by_camera_model and add_model_to_folder:
-                        dest_folder = os.path.join(
-                            folder_path, camera_model, media_type_folder, f"{date_folder}_{camera_model}") if separate_photos_videos else os.path.join(folder_path, camera_model, f"{date_folder}_{camera_model}")
-                    elif by_camera_model:
-                        dest_folder = os.path.join(
-                            folder_path, camera_model, media_type_folder, date_folder) if separate_photos_videos else os.path.join(folder_path, camera_model, date_folder)
-                    elif add_model_to_folder:
-                        dest_folder = os.path.join(
-                            folder_path, media_type_folder, f"{date_folder}_{camera_model}") if separate_photos_videos else os.path.join(folder_path, f"{date_folder}_{camera_model}")
-                    else:
-                        dest_folder = os.path.join(
-                            folder_path, media_type_folder, date_folder) if separate_photos_videos else os.path.join(folder_path, date_folder)
-                    known_files[(basename, date_folder)] = dest_folder
-                    # For MP4, also map its base for extras
-                    if ext == '.MP4':
-                        mp4_base = basename
-                        mp4_dest_map[(mp4_base, date_folder)] = dest_folder
-
-    # Second pass: move files
-    for root, _, files in os.walk(folder_path):
-        print(f"Checking folder: {root} | Files: {len(files)}")
-        counter = 0
-        for file in files:
-            ext = os.path.splitext(file)[1].upper()
-            if ext in valid_exts:
-                counter += 1
-                file_path = os.path.join(root, file)
-                date_folder = get_creation_date(file_path)
-                camera_model = get_camera_model(file_path)
-                if camera_model != "UnknownCamera":
-                    detected_models.add(camera_model)
-                basename, _ = os.path.splitext(file)
-                
-                if separate_photos_videos:
-                    if ext in photo_exts:
-                        media_type_folder = "photos"
-                    elif ext in video_exts:
-                        media_type_folder = "videos"
-                    else:
-                        media_type_folder = "other"
-                    if add_model_to_folder and camera_model != "UnknownCamera":
-                        media_type_folder = f"{media_type_folder}_{camera_model}"
-                else:
-                    media_type_folder = None
-                
-                dest_folder = None
-                # Unified logic for .HIF with UnknownCamera
-                if camera_model == "UnknownCamera" and ext == ".HIF":
-                    dest_folder = known_files.get((basename, date_folder))
-                    if dest_folder is None:
-                        dest_folder = os.path.join(
-                            folder_path, camera_model, media_type_folder, f"{date_folder}_{camera_model}")
-                # For video extras, use MP4's destination if possible
-                elif ext in ['.XML', '.THM', '.LRV']:
-                    mp4_base = get_mp4_base(basename)
-                    dest_folder = mp4_dest_map.get((mp4_base, date_folder))
-                    if not dest_folder:
-                        # fallback to normal logic
-                        if by_camera_model and add_model_to_folder:
-                            dest_folder = os.path.join(
-                                folder_path, camera_model, media_type_folder, f"{date_folder}_{camera_model}") if separate_photos_videos else os.path.join(folder_path, camera_model, f"{date_folder}_{camera_model}")
-                        elif by_camera_model:
-                            dest_folder = os.path.join(
-                                folder_path, camera_model, media_type_folder, date_folder) if separate_photos_videos else os.path.join(folder_path, camera_model, date_folder)
-                        elif add_model_to_folder:
-                            dest_folder = os.path.join(
-                                folder_path, media_type_folder, f"{date_folder}_{camera_model}") if separate_photos_videos else os.path.join(folder_path, f"{date_folder}_{camera_model}")
-                        else:
-                            dest_folder = os.path.join(
-                                folder_path, media_type_folder, date_folder) if separate_photos_videos else os.path.join(folder_path, date_folder)
-                else:
-                    if by_camera_model and add_model_to_folder:
-                        dest_folder = os.path.join(
-                            folder_path, camera_model, media_type_folder, f"{date_folder}_{camera_model}") if separate_photos_videos else os.path.join(folder_path, camera_model, f"{date_folder}_{camera_model}")
-                    elif by_camera_model:
-                        dest_folder = os.path.join(
-                            folder_path, camera_model, media_type_folder, date_folder) if separate_photos_videos else os.path.join(folder_path, camera_model, date_folder)
-                    elif add_model_to_folder:
-                        dest_folder = os.path.join(
-                            folder_path, media_type_folder, f"{date_folder}_{camera_model}") if separate_photos_videos else os.path.join(folder_path, f"{date_folder}_{camera_model}")
-                    else:
-                        dest_folder = os.path.join(
-                            folder_path, media_type_folder, date_folder) if separate_photos_videos else os.path.join(folder_path, date_folder)
-                
-                os.makedirs(dest_folder, exist_ok=True)
-                shutil.move(file_path, os.path.join(dest_folder, file))
-        print(f"Total files moved: {counter}")
-        print(f"Finished checking folder: {root}")
-    
+    # Scan once: collect candidate files, then probe date and camera model in parallel
+    candidates = []
+    for entry in (files if files is not None else iter_files(folder_path)):
+        basename, ext = os.path.splitext(entry.name)
+        ext = ext.upper()
+        if ext in valid_exts:
+            candidates.append((entry, basename, ext))
+    print(f"Checking folder: {folder_path} | Files: {len(candidates)}")
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        probed = list(executor.map(_probe, [c[0] for c in candidates]))
+
+    entries = []
+    for (entry, basename, ext), info in zip(candidates, probed):
+        if info is None:
+            continue
+        date_folder, camera_model = info
+        if camera_model != UNKNOWN_CAMERA:
+            detected_models.add(camera_model)
+        entries.append((entry.path, entry.name, basename, ext, date_folder, camera_model))
+
+    # Single pass: resolve each file's layout once; .HIF files without a model and
+    # video extras are fixed up at move time, once every MP4/photo is known
+    records = []
+    for file_path, file, basename, ext, date_folder, camera_model in entries:
+        # Set media_type_folder only if separating photos/videos
+        if separate_photos_videos:
+            media_type_folder = MEDIA_TYPE_FOLDERS.get(ext, "other")
+            if add_model_to_folder and camera_model != UNKNOWN_CAMERA:
+                media_type_folder = f"{media_type_folder}_{camera_model}"
+        else:
+            media_type_folder = None
+
+        dest_folder = format_dest(camera_model, media_type_folder, date_folder)
+        if camera_model != UNKNOWN_CAMERA:
+            known_files[(basename, date_folder)] = dest_folder
+            # For MP4, also map its base for extras
+            if ext == MP4_EXTENSION:
+                mp4_dest_map[(basename, date_folder)] = dest_folder
+        records.append((file_path, file, basename, ext, date_folder,
+                        camera_model, media_type_folder, dest_folder))
+
+    # Move files
+    counter = 0
+    # Destinations already ensured -> whether they share folder_path's device
+    same_device = {}
+    root_dev = os.stat(folder_path).st_dev
+    for (file_path, file, basename, ext, date_folder,
+         camera_model, media_type_folder, dest_folder) in records:
+        counter += 1
+
+        # Unified logic for .HIF with UnknownCamera
+        if camera_model == UNKNOWN_CAMERA and ext == HIF_EXTENSION:
+            dest_folder = known_files.get((basename, date_folder))
+            if dest_folder is None:
+                dest_folder = os.path.join(
+                    folder_path, camera_model, media_type_folder, f"{date_folder}_{camera_model}")
+        # For video extras, use MP4's destination if possible
+        elif ext in VIDEO_EXTRAS_EXTENSION_SET:
+            mp4_base = get_mp4_base(basename)
+            # fallback to the layout computed above
+            dest_folder = mp4_dest_map.get((mp4_base, date_folder)) or dest_folder
+
+        if dest_folder not in same_device:
+            os.makedirs(dest_folder, exist_ok=True)
+            same_device[dest_folder] = os.stat(dest_folder).st_dev == root_dev
+        dest_path = os.path.join(dest_folder, file)
+        if same_device[dest_folder]:
+            try:
+                os.replace(file_path, dest_path)  # single rename syscall
+                continue
+            except OSError:
+                pass  # e.g. source on a nested mount; let shutil copy instead
+        shutil.move(file_path, dest_path)
+    print(f"Total files moved: {counter}")
+
     # After organizing, update camera model database
     db_models = set(get_camera_models())
-    new_models = detected_models - db_models
-    for model in new_models:
-        add_camera_model(model)
+    add_camera_models(sorted(detected_models - db_models))
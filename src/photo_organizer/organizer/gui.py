@@ -7,7 +7,8 @@ import tkinter as tk
 from tkinter import filedialog
 from photo_organizer.organizer.core import organize_photos
 from photo_organizer.shared.camera_models import get_camera_models
-from photo_organizer.shared.config import ALL_EXTENSIONS
+from photo_organizer.shared.config import ALL_EXTENSION_SET
+from photo_organizer.shared.file_utils import iter_files, tree_unchanged
 
 
 def main():
@@ -58,16 +59,20 @@ def main():
                           wraplength=280, pady=5)
     path_label.pack()
 
-    selected_folder = {'path': None}
+    # 'files' keeps the entries found while counting so organizing can skip a second
+    # walk; 'dir_mtimes' tells whether the tree changed since (then it is rescanned)
+    selected_folder = {'path': None, 'files': None, 'dir_mtimes': None}
 
     def select_folder_only():
         folder_path = filedialog.askdirectory(title='Select Folder')
         if folder_path:
             selected_folder['path'] = folder_path
-            count = 0
-            for root_dir, _, files in os.walk(folder_path):
-                count += sum(1 for file in files if any(file.upper().endswith(ext)
-                             for ext in ALL_EXTENSIONS))
+            selected_folder['dir_mtimes'] = {}
+            selected_folder['files'] = [
+                entry for entry in iter_files(folder_path, selected_folder['dir_mtimes'])
+                if os.path.splitext(entry.name)[1].upper() in ALL_EXTENSION_SET
+            ]
+            count = len(selected_folder['files'])
             path_label.config(
                 text=f"Selected: {folder_path}\nTotal items: {count}")
         print(f"Selected folder: {folder_path}")
@@ -81,10 +86,17 @@ def main():
             add_model_to_folder = add_model_to_folder_var.get()
             media_type = media_type_var.get()
             separate_photos_videos = separate_photos_videos_var.get()
+            files = selected_folder['files']
+            if files is not None and not tree_unchanged(selected_folder['dir_mtimes']):
+                # Files were added, removed or renamed after selection: walk again
+                files = None
             organize_photos(folder_path, by_camera_model=by_camera_model,
                             add_model_to_folder=add_model_to_folder,
                             media_type=media_type,
-                            separate_photos_videos=separate_photos_videos)
+                            separate_photos_videos=separate_photos_videos,
+                            files=files)
+            # Files have moved; a repeat run must rescan
+            selected_folder['files'] = None
             path_label.config(text=f"Organized: {folder_path}")
         else:
             path_label.config(text="No folder selected to organize.")
@@ -6,7 +6,8 @@ import os
 import tkinter as tk
 from tkinter import filedialog
 from photo_organizer.shared.camera_models import get_camera_models
-from photo_organizer.shared.config import ALL_EXTENSIONS
+from photo_organizer.shared.config import ALL_EXTENSION_SET
+from photo_organizer.shared.file_utils import iter_files, existing_names
 
 
 def main():
@@ -49,10 +50,8 @@ def main():
         folder_path = filedialog.askdirectory(title='Select Folder')
         if folder_path:
             selected_folder['path'] = folder_path
-            count = 0
-            for root_dir, _, files in os.walk(folder_path):
-                count += sum(1 for file in files if any(file.upper().endswith(ext)
-                             for ext in ALL_EXTENSIONS))
+            count = sum(1 for entry in iter_files(folder_path)
+                        if os.path.splitext(entry.name)[1].upper() in ALL_EXTENSION_SET)
             path_label.config(
                 text=f"Selected: {folder_path}\nTotal items: {count}")
         print(f"Selected folder: {folder_path}")
@@ -73,31 +72,43 @@ def main():
             path_label.config(text="Please select or enter a camera model.")
             return
         renamed_count = 0
-        for root, dirs, files in os.walk(folder_path):
-            for name in files + dirs:
-                if "UnknownCamera" in name:
-                    old_path = os.path.join(root, name)
-                    new_name = name.replace("UnknownCamera", model)
-                    new_path = os.path.join(root, new_name)
-                    if os.path.isdir(old_path):
-                        if os.path.exists(new_path):
-                            # Move contents from old_path to new_path
-                            for item in os.listdir(old_path):
-                                src_item = os.path.join(old_path, item)
-                                dst_item = os.path.join(new_path, item)
-                                if os.path.exists(dst_item):
-                                    continue  # Skip if already exists
-                                os.rename(src_item, dst_item)
-                            try:
-                                os.rmdir(old_path)
-                            except OSError:
-                                pass  # Directory not empty or error
-                        else:
-                            os.rename(old_path, new_path)
-                        renamed_count += 1
-                    else:
-                        os.rename(old_path, new_path)
+        # Depth-first scandir walk; DirEntry caches the type, so no extra stat
+        # per match. Renamed folders are descended under their new name.
+        stack = [folder_path]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                path = entry.path
+                if "UnknownCamera" in entry.name:
+                    new_name = entry.name.replace("UnknownCamera", model)
+                    new_path = os.path.join(current, new_name)
+                    if is_dir and os.path.exists(new_path):
+                        # Move contents from old path to new_path
+                        taken, key = existing_names(new_path)
+                        with os.scandir(path) as it:
+                            items = list(it)
+                        for item in items:
+                            if key(item.name) in taken:
+                                print(f"Skipped (already in {new_path}): {item.path}")
+                                continue
+                            os.rename(item.path, os.path.join(new_path, item.name))
+                        try:
+                            os.rmdir(path)
+                        except OSError:
+                            stack.append(path)  # Not empty: rename what was left
                         renamed_count += 1
+                        continue  # new_path is walked via its own entry
+                    os.rename(path, new_path)
+                    path = new_path
+                    renamed_count += 1
+                if is_dir:
+                    stack.append(path)
         path_label.config(
             text=f"Renamed {renamed_count} items to {model}.")
 
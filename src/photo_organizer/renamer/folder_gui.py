@@ -11,6 +11,7 @@ from tkinter import filedialog, messagebox
 from pathlib import Path
 from photo_organizer.shared.metadata import get_creation_date, get_camera_model
 from photo_organizer.shared.camera_models import resolve_model_name, add_camera_model
+from photo_organizer.shared.file_utils import iter_files, existing_names
 
 FOLDER_PATTERN = re.compile(r"^(\d{3})(\d)(\d{2})(\d{2})$")
 
@@ -21,24 +22,23 @@ def extract_folder_metadata(folder_path: str):
     Samples first, middle, and last files for consistency.
     Returns tuple: (date, model, sample_file_path) or (None, None, None)
     """
-    files = []
-    for root, _, filenames in os.walk(folder_path):
-        for filename in filenames:
-            if not filename.startswith('.') and not filename.startswith('_'):
-                files.append(os.path.join(root, filename))
+    files = [
+        entry for entry in iter_files(folder_path)
+        if not entry.name.startswith('.') and not entry.name.startswith('_')
+    ]
     
     if not files:
         return None, None, None
     
-    files.sort()
+    files.sort(key=lambda entry: entry.path)
     n = len(files)
     
     indices = [0, n // 2, n - 1] if n > 2 else list(range(n))
     
     for idx in indices:
         try:
-            file_path = files[idx]
-            date = get_creation_date(file_path)
+            file_path = files[idx].path
+            date = get_creation_date(file_path, files[idx])
             model = get_camera_model(file_path)
             
             if date and date != "Unknown":
@@ -57,6 +57,7 @@ def safe_merge_folders(src_path: str, dst_path: str, log_func=None):
     """
     moved = 0
     skipped = 0
+    taken, key = existing_names(dst_path)
     
     for item in os.listdir(src_path):
         src_item = os.path.join(src_path, item)
@@ -76,22 +77,26 @@ def safe_merge_folders(src_path: str, dst_path: str, log_func=None):
                         pass
                 else:
                     shutil.move(src_item, dst_item)
+                    taken.add(key(item))
                     moved += 1
             else:
                 # Handle file
-                if os.path.exists(dst_item):
+                if key(item) in taken:
                     # Create unique name for conflict
                     base, ext = os.path.splitext(item)
                     counter = 1
-                    while os.path.exists(os.path.join(dst_path, f"{base}_dup{counter}{ext}")):
+                    while key(f"{base}_dup{counter}{ext}") in taken:
                         counter += 1
-                    dst_item = os.path.join(dst_path, f"{base}_dup{counter}{ext}")
+                    new_item = f"{base}_dup{counter}{ext}"
+                    dst_item = os.path.join(dst_path, new_item)
                     shutil.move(src_item, dst_item)
+                    taken.add(key(new_item))
                     moved += 1
                     if log_func:
-                        log_func(f"    → Renamed conflict: {item} → {os.path.basename(dst_item)}")
+                        log_func(f"    → Renamed conflict: {item} → {new_item}")
                 else:
                     shutil.move(src_item, dst_item)
+                    taken.add(key(item))
                     moved += 1
         except Exception as e:
             skipped += 1
@@ -3,8 +3,10 @@ Camera models database with JSON storage and backwards compatibility.
 Maps EXIF model names to friendly display names with alias support.
 """
 import json
+import threading
 from pathlib import Path
 import appdirs
+from photo_organizer.shared.config import UNKNOWN_CAMERA
 
 
 APP_NAME = "photo_organizer"
@@ -43,6 +45,11 @@ DEFAULT_MODELS = [
     }
 ]
 
+# In-memory copy of the database and the file mtime it was read at; reloaded when the file changes
+_MODELS: list[dict] | None = None
+_MODELS_MTIME: int | None = None
+_LOCK = threading.RLock()
+
 
 def get_db_dir() -> Path:
     """Get user data directory for the application."""
@@ -115,22 +122,35 @@ def _migrate_from_txt_if_needed():
 
 
 def load_models() -> list[dict]:
-    """Load camera models from JSON database."""
-    _migrate_from_txt_if_needed()
-    db_path = get_db_path()
+    """
+    Load camera models from JSON database.
+    The file is re-read only when its mtime changes; the returned list is shared, do not mutate it.
+    """
+    global _MODELS, _MODELS_MTIME
+    with _LOCK:
+        _migrate_from_txt_if_needed()
+        db_path = get_db_path()
 
-    try:
-        return json.loads(db_path.read_text(encoding='utf-8'))
-    except Exception as e:
-        print(f"Error loading camera models: {e}")
-        return DEFAULT_MODELS
+        try:
+            mtime = db_path.stat().st_mtime_ns
+            if _MODELS is None or mtime != _MODELS_MTIME:
+                _MODELS = json.loads(db_path.read_text(encoding='utf-8'))
+                _MODELS_MTIME = mtime
+        except Exception as e:
+            print(f"Error loading camera models: {e}")
+            return DEFAULT_MODELS
+        return _MODELS
 
 
 def save_models(models: list[dict]):
     """Save camera models to JSON database."""
-    db_path = get_db_path()
-    db_path.write_text(json.dumps(
-        models, indent=2, ensure_ascii=False), encoding='utf-8')
+    global _MODELS, _MODELS_MTIME
+    with _LOCK:
+        db_path = get_db_path()
+        db_path.write_text(json.dumps(
+            models, indent=2, ensure_ascii=False), encoding='utf-8')
+        _MODELS = list(models)
+        _MODELS_MTIME = db_path.stat().st_mtime_ns
 
 
 def get_camera_models() -> list[str]:
@@ -144,8 +164,8 @@ def resolve_model_name(raw_model: str) -> str:
     Resolve EXIF model name to folder-friendly name.
     Checks exif_name, then aliases for a match.
     """
-    if not raw_model or raw_model == "UnknownCamera":
-        return "UnknownCamera"
+    if not raw_model or raw_model == UNKNOWN_CAMERA:
+        return UNKNOWN_CAMERA
 
     models = load_models()
     clean_raw = raw_model.strip().replace('_', ' ')
@@ -166,20 +186,41 @@ def resolve_model_name(raw_model: str) -> str:
 
 def add_camera_model(exif_name: str, display_name: str = None, folder_name: str = None):
     """Add a new camera model to the database."""
-    if not exif_name or exif_name == "UnknownCamera":
+    if not exif_name or exif_name == UNKNOWN_CAMERA:
         return
 
-    models = load_models()
-
-    for model in models:
-        if model.get("exif_name") == exif_name:
-            return
-
-    models.append({
-        "exif_name": exif_name,
-        "display_name": display_name or exif_name,
-        "folder_name": folder_name or display_name or exif_name,
-        "aliases": [exif_name]
-    })
-
-    save_models(models)
+    with _LOCK:
+        models = load_models()
+
+        for model in models:
+            if model.get("exif_name") == exif_name:
+                return
+
+        save_models(models + [{
+            "exif_name": exif_name,
+            "display_name": display_name or exif_name,
+            "folder_name": folder_name or display_name or exif_name,
+            "aliases": [exif_name]
+        }])
+
+
+def add_camera_models(exif_names):
+    """Add several camera models with a single database write."""
+    with _LOCK:
+        models = load_models()
+        known = {m.get("exif_name") for m in models}
+
+        new_models = []
+        for exif_name in exif_names:
+            if not exif_name or exif_name == UNKNOWN_CAMERA or exif_name in known:
+                continue
+            known.add(exif_name)
+            new_models.append({
+                "exif_name": exif_name,
+                "display_name": exif_name,
+                "folder_name": exif_name,
+                "aliases": [exif_name]
+            })
+
+        if new_models:
+            save_models(models + new_models)
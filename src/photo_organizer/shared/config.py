@@ -2,10 +2,22 @@
 Application constants and configuration.
 """
 
+# Sentinel model name for files without camera metadata. Shared as one constant
+# so per-file comparisons hit CPython's identity fast path in str.__eq__.
+UNKNOWN_CAMERA = "UnknownCamera"
+
 # Supported file extensions
 VIDEO_EXTENSIONS = ['.MP4', '.MOV']
 VIDEO_EXTENSIONS_EXTRAS = ['.XML', '.THM', '.LRV']
 PHOTO_EXTENSIONS = ['.HIF', '.ARW', '.JPG']
+HIF_EXTENSION = '.HIF'
+MP4_EXTENSION = '.MP4'
 
 # All extensions combined
 ALL_EXTENSIONS = VIDEO_EXTENSIONS + VIDEO_EXTENSIONS_EXTRAS + PHOTO_EXTENSIONS
+
+# Frozen sets for O(1) membership tests against os.path.splitext(name)[1].upper()
+VIDEO_EXTENSION_SET = frozenset(VIDEO_EXTENSIONS)
+VIDEO_EXTRAS_EXTENSION_SET = frozenset(VIDEO_EXTENSIONS_EXTRAS)
+PHOTO_EXTENSION_SET = frozenset(PHOTO_EXTENSIONS)
+ALL_EXTENSION_SET = frozenset(ALL_EXTENSIONS)
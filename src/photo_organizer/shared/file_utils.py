@@ -1,7 +1,9 @@
 """
 File utility functions for size parsing, formatting, and common operations.
 """
+import os
 import re
+from typing import Callable, Iterator
 
 
 def parse_size(size_str: str) -> int:
@@ -31,3 +33,77 @@ def format_size(size_bytes: int) -> str:
             return f"{size_bytes:.2f} {unit}"
         size_bytes /= 1024
     return f"{size_bytes:.2f} TB"
+
+
+def _ignores_case(path: str, names: list[str]) -> bool:
+    """Probe whether the volume holding path matches names case-insensitively."""
+    present = set(names)
+    for name in names:
+        swapped = name.swapcase()
+        if swapped != name and swapped not in present:
+            return os.path.exists(os.path.join(path, swapped))
+    # No entry to probe with: try the directory's own name instead
+    parent, base = os.path.split(os.path.abspath(path))
+    swapped = base.swapcase()
+    if swapped == base:
+        return False
+    try:
+        return os.path.samefile(path, os.path.join(parent, swapped))
+    except OSError:
+        return False
+
+
+def existing_names(path: str) -> tuple[set[str], Callable[[str], str]]:
+    """
+    List path once for in-memory "is this name taken" checks.
+
+    Returns (names, key): test with key(name) in names, and add key(new_name)
+    after creating an entry. key is str.casefold on case-insensitive volumes
+    (the macOS/Windows defaults), where os.path.exists() ignores case too,
+    and an exact comparison elsewhere.
+    """
+    names = os.listdir(path)
+    key = str.casefold if _ignores_case(path, names) else str
+    return {key(name) for name in names}, key
+
+
+def iter_files(root: str, dir_mtimes: dict[str, int] | None = None) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield DirEntry objects for every file under root.
+
+    Uses an explicit os.scandir stack so callers get DirEntry.stat()
+    (cached per entry) instead of re-stating joined path strings.
+    Unreadable directories are skipped, matching os.walk's default.
+
+    When dir_mtimes is given, it is filled with each walked directory's
+    st_mtime_ns, read before listing; see tree_unchanged().
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            if dir_mtimes is not None:
+                dir_mtimes[current] = os.stat(current).st_mtime_ns
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+def tree_unchanged(dir_mtimes: dict[str, int]) -> bool:
+    """
+    True if no directory recorded by iter_files(..., dir_mtimes) has gained,
+    lost or renamed an entry since: adding a file or subfolder bumps its
+    parent's mtime. One stat per directory, no listing.
+    """
+    try:
+        return all(os.stat(path).st_mtime_ns == mtime for path, mtime in dir_mtimes.items())
+    except OSError:
+        return False
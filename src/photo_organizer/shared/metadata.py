@@ -4,16 +4,54 @@ Handles EXIF data, camera models, and creation dates.
 """
 import os
 import re
-from datetime import datetime
+import struct
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-import exifread
-from PIL import Image
+from photo_organizer.shared.config import UNKNOWN_CAMERA, VIDEO_EXTENSION_SET
 
+# Containers exifread/Pillow cannot parse: video files and their XML/LRV sidecars.
+# (.THM thumbnails are JPEGs and still go through the EXIF readers.)
+NO_EXIF_EXTENSIONS = VIDEO_EXTENSION_SET | {'.XML', '.LRV'}
 
-def get_creation_date(file_path: str) -> str:
-    """Extract creation date as YYYY-MM-DD."""
+# exifread and Pillow are imported on first use: the header fast path and the
+# mtime fallback need neither, and importing this module stays cheap.
+
+
+@lru_cache(maxsize=None)
+def _pil_image():
+    """Import PIL.Image once, registering the HEIF opener if pillow-heif is installed."""
+    from PIL import Image
+    try:
+        import pillow_heif
+        pillow_heif.register_heif_opener()  # lets the Pillow fallback read HIF/HEIC EXIF
+    except ImportError:
+        pass
+    return Image
+
+
+def get_creation_date(file_path: str, entry: os.DirEntry | None = None) -> str:
+    """
+    Extract creation date as YYYY-MM-DD.
+
+    Pass the file's DirEntry when walking with scandir: it is only stat'ed
+    when there is no EXIF date and the modification time is needed.
+    """
+    if os.path.splitext(file_path)[1].upper() not in NO_EXIF_EXTENSIONS:
+        date_str = _read_exif_date(file_path)
+        if date_str:
+            return date_str
+
+    # Fallback to mtime
+    mtime = entry.stat().st_mtime if entry is not None else os.path.getmtime(file_path)
+    return _format_mtime_date(mtime)
+
+
+def _read_exif_date(file_path: str) -> str | None:
+    """DateTimeOriginal as YYYY-MM-DD via exifread, then Pillow."""
     # Try EXIF first
     try:
+        import exifread
         with open(file_path, 'rb') as f:
             tags = exifread.process_file(f, stop_tag="EXIF DateTimeOriginal", details=False)
             dt_str = tags.get("EXIF DateTimeOriginal")
@@ -24,40 +62,151 @@ def get_creation_date(file_path: str) -> str:
     
     # Try Pillow
     try:
-        with Image.open(file_path) as img:
+        with _pil_image().open(file_path) as img:
             exif = img.getexif()
             if exif and 36867 in exif:  # DateTimeOriginal
                 return exif[36867][:10].replace(':', '-')
     except Exception:
         pass
-    
-    # Fallback to mtime
-    return datetime.fromtimestamp(os.path.getmtime(file_path)).strftime('%Y-%m-%d')
 
+    return None
+
+
+# Formatted dates per local calendar day; many files share a day
+_date_cache: dict[date, str] = {}
+
+
+def _format_mtime_date(mtime: float) -> str:
+    """Format a timestamp as local YYYY-MM-DD, reusing the string per day."""
+    day = datetime.fromtimestamp(mtime).date()
+    date_str = _date_cache.get(day)
+    if date_str is None:
+        date_str = day.strftime('%Y-%m-%d')
+        _date_cache[day] = date_str
+    return date_str
+
+
+EXIF_MODEL_TAG = 0x0110
+
+# Sony sidecar XML: camera model attribute near the top of the document
+_MODEL_NAME_RE = re.compile(rb'modelName="([^"]+)"')
+XML_READ_SIZE = 16 * 1024
+
+
+def _parse_tiff_model(f, base: int = 0) -> str | None:
+    """Read the ASCII Model tag from IFD0 of a TIFF structure at offset base of f."""
+    f.seek(base)
+    header = f.read(8)
+    if len(header) < 8:
+        return None
+    byte_order = header[:2]
+    if byte_order == b'II':
+        endian = '<'
+    elif byte_order == b'MM':
+        endian = '>'
+    else:
+        return None
+
+    magic, ifd = struct.unpack_from(endian + 'HI', header, 2)
+    if magic != 42:
+        return None
+    f.seek(base + ifd)
+    raw_count = f.read(2)
+    if len(raw_count) < 2:
+        return None
+    count = struct.unpack(endian + 'H', raw_count)[0]
+    entries = f.read(count * 12)
+
+    for entry in range(0, len(entries) - 11, 12):
+        tag, typ, n = struct.unpack_from(endian + 'HHI', entries, entry)
+        if tag != EXIF_MODEL_TAG:
+            continue
+        if typ != 2:  # ASCII
+            return None
+        if n <= 4:
+            raw = entries[entry + 8:entry + 8 + n]
+        else:
+            f.seek(base + struct.unpack_from(endian + 'I', entries, entry + 8)[0])
+            raw = f.read(n)
+        if len(raw) < n:
+            return None
+        # Only the NUL terminator goes: exifread and Pillow keep padding spaces,
+        # and every reader must yield the same folder name for one camera
+        return raw.split(b'\x00', 1)[0].decode('ascii', 'replace') or None
+    return None
+
+
+def _read_exif_model(file_path: str) -> str | None:
+    """
+    Fast path: pull the Model tag straight from the file header.
+    Handles JPEG (APP1 Exif segment) and TIFF-based files such as ARW.
+    Only the segment headers and IFD0 are read, wherever they sit in the file.
+    """
+    with open(file_path, 'rb') as f:
+        soi = f.read(2)
+        if soi in (b'II', b'MM'):
+            return _parse_tiff_model(f)
+
+        if soi != b'\xff\xd8':
+            return None
+
+        pos = 2
+        while True:
+            segment = f.read(10)
+            if len(segment) < 4 or segment[0] != 0xFF:
+                return None
+            marker = segment[1]
+            if marker in (0xD9, 0xDA):  # EOI / start of scan: no more metadata
+                return None
+            length = struct.unpack_from('>H', segment, 2)[0]
+            if marker == 0xE1 and segment[4:10] == b'Exif\x00\x00':
+                return _parse_tiff_model(f, pos + 10)
+            pos += 2 + length
+            f.seek(pos)
+
+
+def _read_image_model(file_path: str) -> str | None:
+    """Model tag via the header fast path, then exifread, then Pillow."""
+    # Fast path: direct APP1/IFD0 parse (JPG, ARW and other TIFF-based RAW)
+    try:
+        model = _read_exif_model(file_path)
+        if model:
+            return model
+    except Exception:
+        pass
 
-def get_camera_model(file_path: str) -> str:
-    """Extract camera model with video XML fallback."""
-    ext = Path(file_path).suffix.upper()
-    
     # Try ExifRead (best for RAW/JPG)
     try:
+        import exifread
         with open(file_path, 'rb') as f:
             tags = exifread.process_file(f, stop_tag="Image Model", details=False)
             model = tags.get("Image Model")
             if model:
-                return str(model).replace('/', '_').replace(' ', '_')
+                return str(model)
     except Exception:
         pass
-    
-    # Try Pillow (for TIFF/general)
+
+    # Try Pillow (for TIFF/HEIF/general)
     try:
-        with Image.open(file_path) as img:
+        with _pil_image().open(file_path) as img:
             exif = img.getexif()
             if exif and 272 in exif:  # Model tag
-                return str(exif[272]).replace('/', '_').replace(' ', '_')
+                return str(exif[272])
     except Exception:
         pass
-    
+
+    return None
+
+
+def get_camera_model(file_path: str) -> str:
+    """Extract camera model with video XML fallback."""
+    ext = Path(file_path).suffix.upper()
+
+    if ext not in NO_EXIF_EXTENSIONS:
+        model = _read_image_model(file_path)
+        if model:
+            return model.replace('/', '_').replace(' ', '_')
+
     # Video XML fallback (Sony/GoPro)
     if ext in {'.MP4', '.MOV'}:
         base = os.path.splitext(file_path)[0]
@@ -65,12 +214,17 @@ def get_camera_model(file_path: str) -> str:
             xml_path = base + suffix
             if os.path.exists(xml_path):
                 try:
-                    with open(xml_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        match = re.search(r'modelName="([^"]+)"', content)
-                        if match:
-                            return match.group(1).replace('/', '_').replace(' ', '_')
+                    with open(xml_path, 'rb') as f:
+                        # <Device modelName="..."> sits in the header; allow one
+                        # more chunk for long preambles, never the whole file
+                        content = f.read(XML_READ_SIZE)
+                        match = _MODEL_NAME_RE.search(content)
+                        if match is None and len(content) == XML_READ_SIZE:
+                            match = _MODEL_NAME_RE.search(content + f.read(XML_READ_SIZE))
+                    if match:
+                        model = match.group(1).decode('utf-8', 'replace')
+                        return model.replace('/', '_').replace(' ', '_')
                 except Exception:
                     pass
     
-    return "UnknownCamera"
+    return UNKNOWN_CAMERA
@@ -0,0 +1,44 @@
+"""
+Camera model readers must agree: the Model string becomes the camera folder name,
+so the header fast path has to return exactly what exifread does.
+"""
+import os
+import tempfile
+import unittest
+
+from PIL import Image
+
+from photo_organizer.shared.metadata import _read_exif_model
+
+try:
+    import exifread
+except ImportError:
+    exifread = None
+
+
+@unittest.skipIf(exifread is None, "exifread not installed")
+class FastPathMatchesExifreadTest(unittest.TestCase):
+    def _check(self, fmt, name, model):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, name)
+            exif = Image.Exif()
+            exif[0x0110] = model
+            Image.new("RGB", (8, 8)).save(path, fmt, exif=exif)
+            with open(path, 'rb') as f:
+                tags = exifread.process_file(f, stop_tag="Image Model", details=False)
+            self.assertEqual(_read_exif_model(path), str(tags.get("Image Model")))
+
+    def test_padded_model(self):
+        # Trailing space, as some bodies write it
+        for fmt, name in (("JPEG", "probe.jpg"), ("TIFF", "probe.tif")):
+            with self.subTest(fmt=fmt):
+                self._check(fmt, name, "NIKON D750 ")
+
+    def test_plain_model(self):
+        for fmt, name in (("JPEG", "probe.jpg"), ("TIFF", "probe.tif")):
+            with self.subTest(fmt=fmt):
+                self._check(fmt, name, "ILCE-6700")
+
+
+if __name__ == "__main__":
+    unittest.main()